@@ -0,0 +1,157 @@
+"""Shared helpers for auditing and fixing Claude Code configurations across raibid-labs."""
+
+import copy
+import functools
+import json
+import mmap
+import os
+import types
+from pathlib import Path
+from typing import Set
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib json module
+    orjson = None
+
+# Configuration
+ORG = "raibid-labs"
+WORKSPACE_DIR = Path("/home/beengud/raibid-labs")
+BASE_CONFIG_URL = "https://raw.githubusercontent.com/raibid-labs/workspace/main/.claude/base-project.json"
+REPORT_FILE = WORKSPACE_DIR / "workspace" / "claude-config-audit-report.json"
+# Per-repo work is file I/O, so threads mostly wait; this caps open files
+MAX_WORKERS = 64
+
+# Fixed part of a new project config; per-repo fields are filled in by copy
+CONFIG_TEMPLATE = {
+    "$schema": "https://claude.ai/schemas/project-config.json",
+    "version": "1.0.0",
+    "extends": BASE_CONFIG_URL,
+    "description": None,
+    "project": None,
+    "language": None,
+    "customization": {
+        "mcpServers": {},
+        "workflows": {},
+        "agents": []
+    }
+}
+
+# Primary language for each repo type
+LANGUAGE_MAP = types.MappingProxyType({
+    "rust-service": "rust",
+    "python-ml": "python",
+    "typescript-docs": "typescript",
+    "mcp-integration": "typescript",
+    "iac-k8s": "hcl",
+    "docs": "markdown",
+})
+
+# Colors
+class Colors:
+    RED = '\033[0;31m'
+    GREEN = '\033[0;32m'
+    YELLOW = '\033[1;33m'
+    BLUE = '\033[0;34m'
+    NC = '\033[0m'
+
+# Pre-rendered colored markers for the summary output
+RULE = f"{Colors.BLUE}{'='*70}{Colors.NC}"
+OK = f"{Colors.GREEN}✓{Colors.NC}"
+FIXED = f"{Colors.YELLOW}✓{Colors.NC}"
+WARN = f"{Colors.YELLOW}⚠{Colors.NC}"
+INFO = f"{Colors.BLUE}ℹ{Colors.NC}"
+ERR = f"{Colors.RED}✗{Colors.NC}"
+
+def loads_json(data):
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps_json(obj) -> bytes:
+    """Serialize to 2-space indented JSON bytes with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2) + "\n").encode()
+
+def write_json(path: Path, obj) -> None:
+    """Write JSON in a single write and atomically replace ``path``.
+
+    The write is skipped when ``path`` already holds identical content.
+    """
+    payload = dumps_json(obj)
+    try:
+        if path.read_bytes() == payload:
+            return
+    except OSError:
+        pass
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+def list_cloned_repos(workspace_dir: Path) -> Set[str]:
+    """Return the names of all directories in the workspace with one listing."""
+    try:
+        with os.scandir(workspace_dir) as it:
+            return {e.name for e in it if e.is_dir()}
+    except OSError:
+        return set()
+
+def detect_package_json_type(path: str) -> str:
+    """Detect JS repository type from the packages named in package.json."""
+    # The marker package names are unique enough that a quoted substring
+    # match is as good as walking the parsed dependency maps, and scanning
+    # a read-only mapping avoids copying large monorepo manifests
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(b'"@modelcontextprotocol/sdk"') != -1:
+                return "mcp-integration"
+            elif mm.find(b'"vitepress"') != -1 or mm.find(b'"docusaurus"') != -1:
+                return "typescript-docs"
+    except (OSError, ValueError):  # ValueError: empty files cannot be mapped
+        pass
+    return "library"
+
+@functools.lru_cache(maxsize=None)
+def detect_repo_type(repo_dir: Path) -> str:
+    """Detect repository type based on files and structure."""
+    # One directory listing instead of a stat per marker file
+    try:
+        with os.scandir(repo_dir) as it:
+            entries = {e.name: e for e in it}
+    except OSError:
+        entries = {}
+
+    def is_dir(name: str) -> bool:
+        return name in entries and entries[name].is_dir()
+
+    if "Cargo.toml" in entries:
+        return "rust-service"
+    elif "package.json" in entries:
+        return detect_package_json_type(entries["package.json"].path)
+    elif "pyproject.toml" in entries or "setup.py" in entries:
+        if repo_dir.name.startswith("dgx-"):
+            return "python-ml"
+        return "library"
+    elif is_dir("terraform") or is_dir("k8s"):
+        return "iac-k8s"
+    elif "mkdocs.yml" in entries:
+        return "docs"
+    return "library"
+
+def detect_primary_language(repo_type: str) -> str:
+    """Detect primary language based on repo type."""
+    return LANGUAGE_MAP.get(repo_type, "unknown")
+
+def create_config(repo_name: str, repo_type: str) -> dict:
+    """Create a config template for a repository."""
+    config = copy.deepcopy(CONFIG_TEMPLATE)
+    config["description"] = f"Claude Code configuration for {repo_name}"
+    config["project"] = {
+        "name": repo_name,
+        "type": repo_type,
+        "repository": f"https://github.com/{ORG}/{repo_name}"
+    }
+    config["language"] = {"primary": detect_primary_language(repo_type)}
+    return config
@@ -0,0 +1,228 @@
+"""Audit Claude Code configurations across all raibid-labs repositories."""
+
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from . import (
+    ERR, INFO, MAX_WORKERS, OK, ORG, REPORT_FILE, RULE, WARN, WORKSPACE_DIR,
+    Colors, detect_repo_type, list_cloned_repos, loads_json, write_json,
+)
+
+REPO_CACHE_FILE = WORKSPACE_DIR / ".cache" / "repos.json"
+REPO_CACHE_TTL = 3600  # seconds
+
+# Every status check_config can report
+STATUSES = ("ok", "missing_config", "wrong_extends", "no_extends",
+            "not_cloned", "workspace", "invalid_json", "error", "unknown")
+
+# Archived repos are filtered server-side, so only names come back
+ACTIVE_REPOS_QUERY = """
+query($org: String!) {
+  organization(login: $org) {
+    repositories(first: 100, isArchived: false) {
+      nodes { name }
+    }
+  }
+}
+"""
+
+def get_active_repos(refresh: bool = False) -> List[str]:
+    """Get list of active (non-archived) repositories, cached on disk."""
+    if not refresh:
+        try:
+            if REPO_CACHE_FILE.stat().st_mtime > time.time() - REPO_CACHE_TTL:
+                return loads_json(REPO_CACHE_FILE.read_bytes())
+        except (OSError, json.JSONDecodeError):
+            pass
+
+    repos = fetch_active_repos()
+
+    try:
+        REPO_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        write_json(REPO_CACHE_FILE, repos)
+        REPO_CACHE_FILE.touch()  # restart the TTL even if the list is unchanged
+    except OSError:
+        pass
+
+    return repos
+
+def fetch_active_repos() -> List[str]:
+    """Fetch list of active (non-archived) repositories from GitHub."""
+    result = subprocess.run(
+        ["gh", "api", "graphql", "-f", f"query={ACTIVE_REPOS_QUERY}", "-F", f"org={ORG}"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    nodes = loads_json(result.stdout)["data"]["organization"]["repositories"]["nodes"]
+    return sorted(n["name"] for n in nodes)
+
+def check_config(repo_name: str, repo_dir: Path, cloned: Optional[bool] = None) -> Dict:
+    """Check repository configuration status."""
+    config_file = repo_dir / ".claude" / "project.json"
+
+    if cloned is None:
+        cloned = repo_dir.exists()
+
+    result = {
+        "name": repo_name,
+        "cloned": cloned,
+        "has_config": cloned and config_file.exists(),
+        "extends_base": False,
+        "repo_type": None,
+        "status": "unknown",
+        "issue": None
+    }
+
+    if not result["cloned"]:
+        result["status"] = "not_cloned"
+        return result
+
+    if repo_name == "workspace":
+        result["status"] = "workspace"
+        result["issue"] = "This is the base config repository"
+        return result
+
+    result["repo_type"] = detect_repo_type(repo_dir)
+
+    if not result["has_config"]:
+        result["status"] = "missing_config"
+        result["issue"] = "No .claude/project.json found"
+        return result
+
+    # Check if config extends base
+    try:
+        with open(config_file, "rb") as f:
+            config = loads_json(f.read())
+            extends = config.get("extends", "")
+
+            if "workspace" in extends and "base-project.json" in extends:
+                result["extends_base"] = True
+                result["status"] = "ok"
+            elif extends:
+                result["status"] = "wrong_extends"
+                result["issue"] = f"Extends: {extends}"
+            else:
+                result["status"] = "no_extends"
+                result["issue"] = "No 'extends' field"
+    except json.JSONDecodeError:
+        result["status"] = "invalid_json"
+        result["issue"] = "Invalid JSON in config file"
+    except Exception as e:
+        result["status"] = "error"
+        result["issue"] = str(e)
+
+    return result
+
+def run(refresh: bool = False) -> List[Dict]:
+    """Audit all repositories, print the summary, save the report, and return the results."""
+    print(RULE)
+    print(f"{Colors.BLUE}  Raibid Labs Claude Configuration Audit{Colors.NC}")
+    print(f"{RULE}\n")
+
+    # Get repositories
+    print("Fetching repository list from GitHub...", flush=True)
+    repos = get_active_repos(refresh=refresh)
+    print(f"{Colors.GREEN}Found {len(repos)} active repositories{Colors.NC}\n")
+
+    # One workspace listing answers "is it cloned?" for every repo
+    cloned_repos = list_cloned_repos(WORKSPACE_DIR)
+
+    # Audit each repository (I/O-bound, so overlap the filesystem checks)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(
+            lambda r: check_config(r, WORKSPACE_DIR / r, cloned=r in cloned_repos),
+            repos,
+        ))
+
+    # Categorize results in a single pass
+    buckets = {status: [] for status in STATUSES}
+    for r in results:
+        buckets[r["status"]].append(r)
+
+    ok_repos = buckets["ok"]
+    missing_config = buckets["missing_config"]
+    wrong_extends = buckets["wrong_extends"]
+    no_extends = buckets["no_extends"]
+    not_cloned = buckets["not_cloned"]
+    workspace_repos = buckets["workspace"]
+    errors = buckets["invalid_json"] + buckets["error"]
+
+    # Print summary
+    print(f"\n{RULE}")
+    print(f"{Colors.BLUE}  Summary{Colors.NC}")
+    print(f"{RULE}\n")
+
+    print(f"Total repositories: {Colors.BLUE}{len(repos)}{Colors.NC}")
+    print(f"{OK} Correct configuration: {Colors.GREEN}{len(ok_repos)}{Colors.NC}")
+    print(f"{WARN} Missing .claude/project.json: {Colors.YELLOW}{len(missing_config)}{Colors.NC}")
+    print(f"{WARN} Wrong 'extends' value: {Colors.YELLOW}{len(wrong_extends)}{Colors.NC}")
+    print(f"{WARN} No 'extends' field: {Colors.YELLOW}{len(no_extends)}{Colors.NC}")
+    print(f"{INFO}  Not cloned locally: {len(not_cloned)}")
+    print(f"{INFO}  Workspace repository: {len(workspace_repos)}")
+    print(f"{ERR} Errors: {Colors.RED}{len(errors)}{Colors.NC}\n")
+
+    # Detailed output
+    if missing_config:
+        print(f"{Colors.YELLOW}Repositories missing .claude/project.json:{Colors.NC}")
+        for r in missing_config:
+            print(f"  - {r['name']} ({r['repo_type']})")
+        print()
+
+    if wrong_extends or no_extends:
+        print(f"{Colors.YELLOW}Repositories with incorrect extends:{Colors.NC}")
+        for r in wrong_extends + no_extends:
+            print(f"  - {r['name']}: {r['issue']}")
+        print()
+
+    if errors:
+        print(f"{Colors.RED}Repositories with errors:{Colors.NC}")
+        for r in errors:
+            print(f"  - {r['name']}: {r['issue']}")
+        print()
+
+    if ok_repos:
+        print(f"{Colors.GREEN}Repositories with correct configuration:{Colors.NC}")
+        for r in ok_repos:
+            print(f"  - {r['name']}")
+        print()
+
+    # Save detailed report
+    write_json(REPORT_FILE, {
+        "summary": {
+            "total": len(repos),
+            "ok": len(ok_repos),
+            "missing_config": len(missing_config),
+            "wrong_extends": len(wrong_extends),
+            "no_extends": len(no_extends),
+            "not_cloned": len(not_cloned),
+            "errors": len(errors)
+        },
+        "results": results
+    })
+
+    print(f"{Colors.GREEN}✓ Detailed report saved to: {REPORT_FILE}{Colors.NC}\n")
+
+    # Offer to fix
+    needs_fix = len(missing_config) + len(wrong_extends) + len(no_extends)
+    if needs_fix > 0:
+        print(f"{Colors.YELLOW}{needs_fix} repositories need configuration updates{Colors.NC}")
+        print(f"\nTo apply fixes, run:")
+        print(f"  python3 scripts/fix-claude-configs.py")
+
+    print(f"\n{RULE}")
+    sys.stdout.flush()
+
+    return results
+
+def main():
+    """Command-line entry point for ``claude_configs audit``."""
+    # Parse arguments
+    refresh = "--refresh" in sys.argv
+
+    run(refresh=refresh)
@@ -0,0 +1,27 @@
+"""Command-line dispatch for the ``audit`` and ``fix`` subcommands."""
+
+import io
+import sys
+from typing import Optional
+
+from . import audit, fix
+
+COMMANDS = {
+    "audit": audit.main,
+    "fix": fix.main,
+}
+
+def main(command: Optional[str] = None):
+    """Run a subcommand, taken from ``sys.argv[1]`` when not given."""
+    if command is None:
+        if len(sys.argv) < 2 or sys.argv[1] not in COMMANDS:
+            print(f"Usage: python3 -m claude_configs {{{','.join(COMMANDS)}}} [options]")
+            sys.exit(2)
+        command = sys.argv[1]
+
+    # The summaries are dozens of short prints; block-buffer them even on a
+    # TTY so they go out in a few writes. Commands flush before slow steps.
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
+    COMMANDS[command]()
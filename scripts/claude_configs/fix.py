@@ -0,0 +1,174 @@
+"""Fix Claude Code configurations across all raibid-labs repositories."""
+
+import json
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from . import (
+    BASE_CONFIG_URL, ERR, FIXED, INFO, MAX_WORKERS, OK, REPORT_FILE, RULE,
+    WORKSPACE_DIR, Colors, create_config, detect_repo_type, list_cloned_repos,
+    loads_json, write_json,
+)
+from .audit import run as run_audit
+
+# Label, summary counter and verbose detail for each fix_repository result
+RESULT_HANDLERS = {
+    "created": (f"{Colors.GREEN}✓ Created{Colors.NC}", "created",
+                lambda r: f"Type: {r['repo_type']}"),
+    "fixed": (f"{Colors.YELLOW}✓ Fixed{Colors.NC}", "fixed",
+              lambda r: f"Issue: {r.get('issue', 'Unknown')}"),
+    "ok": (f"{Colors.GREEN}✓ Already OK{Colors.NC}", None, None),
+    "error": (f"{Colors.RED}✗ Error{Colors.NC}", "error", None),
+    "not_cloned": (f"{Colors.BLUE}ℹ Skipped (not cloned){Colors.NC}", "skipped", None),
+    "skipped": (f"{Colors.BLUE}ℹ Skipped{Colors.NC}", "skipped", None),
+}
+
+def fix_repository(repo_name: str, repo_dir: Path, repo_type: Optional[str] = None,
+                   cloned: Optional[bool] = None, dry_run: bool = False) -> str:
+    """Fix configuration for a single repository.
+
+    ``repo_type`` (from the audit report) and ``cloned`` (from a workspace
+    listing) are used when given so the repository does not have to be
+    re-scanned.
+    """
+    config_file = repo_dir / ".claude" / "project.json"
+    config_dir = repo_dir / ".claude"
+
+    # Skip workspace
+    if repo_name == "workspace":
+        return "skipped"
+
+    # Skip if not cloned
+    if cloned is None:
+        cloned = repo_dir.exists()
+    if not cloned:
+        return "not_cloned"
+
+    if repo_type is None:
+        repo_type = detect_repo_type(repo_dir)
+
+    # Create or fix config
+    if not config_file.exists():
+        # Create new config
+        if not dry_run:
+            config_dir.mkdir(exist_ok=True)
+            config = create_config(repo_name, repo_type)
+            write_json(config_file, config)
+        return "created"
+    else:
+        # Fix existing config
+        try:
+            with open(config_file, "rb") as f:
+                config = loads_json(f.read())
+
+            extends = config.get("extends", "")
+
+            # Check if extends is correct
+            if "workspace" in extends and "base-project.json" in extends:
+                return "ok"
+
+            # Fix extends field
+            if not dry_run:
+                config["extends"] = BASE_CONFIG_URL
+                write_json(config_file, config)
+
+            return "fixed"
+
+        except json.JSONDecodeError:
+            return "error"
+
+def main():
+    """Command-line entry point for ``claude_configs fix``."""
+    # Parse arguments
+    dry_run = "--dry-run" in sys.argv
+    verbose = "--verbose" in sys.argv or "-v" in sys.argv
+    audit_first = "--run-audit" in sys.argv
+
+    print(RULE)
+    print(f"{Colors.BLUE}  Raibid Labs Claude Configuration Fix{Colors.NC}")
+    print(f"{RULE}\n")
+
+    if dry_run:
+        print(f"{Colors.YELLOW}Running in DRY RUN mode - no changes will be made{Colors.NC}\n")
+
+    if audit_first:
+        # Use the audit results in memory instead of re-reading the report
+        results = run_audit(refresh="--refresh" in sys.argv)
+        print()
+    else:
+        # Load audit report
+        if not REPORT_FILE.exists():
+            print(f"{Colors.RED}Error: Audit report not found. Run audit script first:{Colors.NC}")
+            print("  python3 scripts/audit-claude-configs.py")
+            print("  (or pass --run-audit)")
+            sys.exit(1)
+
+        with open(REPORT_FILE, "rb") as f:
+            report = loads_json(f.read())
+
+        results = report["results"]
+
+    # Filter repos that need fixing
+    to_fix = [r for r in results
+              if r["status"] in ["missing_config", "wrong_extends", "no_extends"]
+              and r["cloned"]]
+
+    print(f"Found {Colors.YELLOW}{len(to_fix)}{Colors.NC} repositories that need fixing\n", flush=True)
+
+    if not to_fix:
+        print(f"{Colors.GREEN}✓ All repositories are correctly configured!{Colors.NC}")
+        return
+
+    # Fix each repository
+    counts = Counter()
+
+    cloned_repos = list_cloned_repos(WORKSPACE_DIR)
+
+    # Repos are independent, so overlap their file I/O; map() keeps input order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        fix_results = list(executor.map(
+            lambda r: fix_repository(r["name"], WORKSPACE_DIR / r["name"],
+                                     repo_type=r.get("repo_type"),
+                                     cloned=r["name"] in cloned_repos, dry_run=dry_run),
+            to_fix,
+        ))
+
+    for i, (repo_info, result) in enumerate(zip(to_fix, fix_results), 1):
+        repo_name = repo_info["name"]
+
+        print(f"[{i}/{len(to_fix)}] {repo_name}...", end=" ")
+
+        label, counter, detail = RESULT_HANDLERS[result]
+        print(label)
+        if counter:
+            counts[counter] += 1
+        if verbose and detail:
+            print(f"       {detail(repo_info)}")
+
+    # Summary
+    print(f"\n{RULE}")
+    print(f"{Colors.BLUE}  Summary{Colors.NC}")
+    print(f"{RULE}\n")
+
+    print(f"{OK} Configurations created: {Colors.GREEN}{counts['created']}{Colors.NC}")
+    print(f"{FIXED} Configurations fixed: {Colors.YELLOW}{counts['fixed']}{Colors.NC}")
+    if counts["error"]:
+        print(f"{ERR} Errors: {Colors.RED}{counts['error']}{Colors.NC}")
+    if counts["skipped"]:
+        print(f"{INFO}  Skipped: {counts['skipped']}")
+
+    if dry_run:
+        print(f"\n{Colors.BLUE}Dry run complete - no changes were made{Colors.NC}")
+        print(f"\nTo apply changes, run:")
+        print(f"  python3 scripts/fix-claude-configs.py")
+    else:
+        print(f"\n{Colors.GREEN}✓ All changes have been applied{Colors.NC}")
+        print(f"\nNext steps:")
+        print(f"  1. Run audit again to verify: python3 scripts/audit-claude-configs.py")
+        print(f"  2. Review changes in each repository")
+        print(f"  3. Commit changes to each repository")
+
+    print(f"\n{RULE}")